@@ -1,29 +1,81 @@
-from tinydb import TinyDB, Query
+import sqlite3
 from typing import Optional, Dict, Any
-from .data_models import User
+import orjson
+from .data_models import User, Profile, Goals, MacroTargets
+
+def _user_from_record(user_data: Dict[str, Any]) -> User:
+    """Build a User from a stored record without re-validating it.
+
+    Records are only written from already-validated models, so the nested
+    models are assembled with model_construct instead of a full validation pass.
+    """
+    goals = dict(user_data["goals"])
+    if goals.get("macro_targets") is not None:
+        goals["macro_targets"] = MacroTargets.model_construct(**goals["macro_targets"])
+    return User.model_construct(**{
+        **user_data,
+        "profile": Profile.model_construct(**user_data["profile"]),
+        "goals": Goals.model_construct(**goals),
+    })
 
 class DatabaseManager:
-    def __init__(self, db_path="fuelyt_data.json"):
-        self.db = TinyDB(db_path)
-        self.users_table = self.db.table('users')
+    def __init__(self, db_path="fuelyt.db"):
+        # One autocommit connection shared by the event loop and tool threads, so statements
+        # from this process run one at a time. WAL lets separate worker processes read while another writes.
+        self.conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS users (user_id TEXT PRIMARY KEY, data TEXT NOT NULL)")
+
+    def _load_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Return the raw user record as a dict, or None if the user does not exist."""
+        row = self.conn.execute("SELECT data FROM users WHERE user_id = ?", (user_id,)).fetchone()
+        if row is None:
+            return None
+        return orjson.loads(row[0])
 
     def get_user(self, user_id: str) -> Optional[User]:
-        UserQuery = Query()
-        user_data = self.users_table.get(UserQuery.user_id == user_id)
+        user_data = self._load_user(user_id)
         if user_data:
-            return User(**user_data)
+            return _user_from_record(user_data)
         return None
 
+    def get_user_section(self, user_id: str, section: str) -> Optional[Any]:
+        """Return one top-level section of the raw user record without building a full User.
+
+        Only the requested section is extracted and decoded. Together with
+        update_user_section, this lets the logging and scheduling tools
+        read and write their section without decoding the rest of the record
+        (e.g. the conversation history) in Python.
+        """
+        row = self.conn.execute(
+            "SELECT json_quote(json_extract(data, '$.' || ?)) FROM users WHERE user_id = ?", (section, user_id)
+        ).fetchone()
+        if row is None:
+            return None
+        # json_quote turns scalars into JSON text and a missing section into 'null'
+        value = orjson.loads(row[0])
+        return value if value is not None else {}
+
+    def update_user_section(self, user_id: str, section: str, value: Any) -> bool:
+        """Replace one top-level section of the user record in place. Returns False if the user does not exist."""
+        cursor = self.conn.execute(
+            "UPDATE users SET data = json_set(data, '$.' || ?, json(?)) WHERE user_id = ?",
+            (section, orjson.dumps(value).decode(), user_id),
+        )
+        return cursor.rowcount > 0
+
     def create_user(self, user: User) -> User:
-        self.users_table.insert(user.dict())
+        self.conn.execute(
+            "INSERT INTO users (user_id, data) VALUES (?, ?)",
+            (user.user_id, orjson.dumps(user.model_dump()).decode()),
+        )
         return user
 
     def update_user(self, user_id: str, updates: Dict[str, Any]) -> Optional[User]:
-        UserQuery = Query()
-        
         # To handle nested updates correctly, we'll fetch the user, update the
         # specific fields, and then write the entire object back.
-        user_data = self.users_table.get(UserQuery.user_id == user_id)
+        user_data = self._load_user(user_id)
         if not user_data:
             return None
         
@@ -41,8 +93,11 @@ class DatabaseManager:
             else:
                 user_data[key] = value
 
-        self.users_table.update(user_data, UserQuery.user_id == user_id)
-        return self.get_user(user_id)
+        self.conn.execute(
+            "UPDATE users SET data = ? WHERE user_id = ?",
+            (orjson.dumps(user_data).decode(), user_id),
+        )
+        return _user_from_record(user_data)
 
     def update_user_workouts(self, user_id: str, workouts: Dict[str, Any]) -> Optional[User]:
         """A dedicated method to update the workouts field."""
@@ -12,7 +12,7 @@ from .tools import (
     LogWorkoutInput, UpdateUserProfileInput, LogMealInput, CreateOrUpdateGoalInput,
     ScheduleWorkoutInput, ScheduleMealInput, GetScheduleInput
 )
-import json
+import orjson
 
 # Load system prompt from file
 with open("agent/system_prompt.txt", "r") as f:
@@ -29,6 +29,23 @@ tools = [
     tool(get_schedule, args_schema=GetScheduleInput),
 ]
 
+# Template for users created on their first message. User validation builds fresh
+# Profile/Goals objects from it, so the shared dict is never mutated or deep-copied.
+DEFAULT_USER_DATA = {
+    "profile": {
+        "name": "Demo User",
+        "age": 30,
+        "gender": "Not specified",
+        "height_cm": 175,
+        "weight_kg": 70
+    },
+    "goals": {
+        "primary_goal": "maintenance"
+    }
+}
+
+EMPTY_MESSAGE_REPLY = "Could you say a bit more? Tell me about a workout, a meal, or what you'd like help with."
+
 class AgentHandler:
     def __init__(self):
         self.chat_model = ChatOpenAI(
@@ -52,22 +69,15 @@ class AgentHandler:
         ])
 
     async def handle_chat(self, chat_message: ChatMessage):
+        # Nothing to act on: answer directly without touching the database or the model
+        if not chat_message.message.strip():
+            yield f"data: {orjson.dumps({'content': EMPTY_MESSAGE_REPLY}).decode()}\n\n"
+            return
+
         user = db_manager.get_user(chat_message.user_id)
         if not user:
             # If user does not exist, create a new one with default values
-            new_user_data = {
-                "profile": {
-                    "name": "Demo User",
-                    "age": 30,
-                    "gender": "Not specified",
-                    "height_cm": 175,
-                    "weight_kg": 70
-                },
-                "goals": {
-                    "primary_goal": "maintenance"
-                }
-            }
-            user = User(user_id=chat_message.user_id, **new_user_data)
+            user = User(user_id=chat_message.user_id, **DEFAULT_USER_DATA)
             db_manager.create_user(user)
 
         chat_history = self._reconstruct_history(user)
@@ -82,7 +92,7 @@ class AgentHandler:
         }):
             if "output" in chunk:
                 full_response += chunk["output"]
-                yield f"data: {json.dumps({'content': chunk['output']})}\n\n"
+                yield f"data: {orjson.dumps({'content': chunk['output']}).decode()}\n\n"
         
         # After streaming is complete, save the conversation history
         self._update_conversation_history(user, chat_message.message, full_response)
@@ -99,6 +109,6 @@ class AgentHandler:
         history = user.ai_context.get("conversation_history", [])
         history.append({"user": user_message, "ai": ai_response})
         user.ai_context["conversation_history"] = history
-        db_manager.update_user(user.user_id, {"ai_context": user.ai_context})
+        db_manager.update_user_section(user.user_id, "ai_context", user.ai_context)
 
 agent_handler = AgentHandler()
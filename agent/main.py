@@ -1,5 +1,7 @@
-from fastapi import FastAPI
+import sqlite3
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from starlette.responses import StreamingResponse
 from .data_models import ChatMessage, User
 from .handler import agent_handler, tools
@@ -23,6 +25,7 @@ app = FastAPI(
     title="Fuelyt AI Agent",
     description="AI agent to help athletes optimize their nutrition and performance.",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS configuration
@@ -53,7 +56,10 @@ async def chat(chat_message: ChatMessage):
 @app.post("/users", tags=["Users"])
 async def create_user(user: User):
     """Create a new user."""
-    return db_manager.create_user(user)
+    try:
+        return db_manager.create_user(user)
+    except sqlite3.IntegrityError:
+        raise HTTPException(status_code=409, detail=f"User with ID '{user.user_id}' already exists.")
 
 @app.get("/tools", tags=["Agent"])
 async def get_tools():
@@ -1,7 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import date
-import json
+import orjson
 
 # --- Tool Input Schemas ---
 
@@ -66,8 +66,8 @@ class GetScheduleInput(BaseModel):
 def log_workout(user_id: str, workout_type: str, duration_minutes: int, calories_burned: Optional[int] = None, notes: Optional[str] = None) -> str:
     """Logs a new workout for the user."""
     from .database_manager import db_manager
-    user = db_manager.get_user(user_id)
-    if not user:
+    workouts = db_manager.get_user_section(user_id, "workouts")
+    if workouts is None:
         return f"Error: User with ID '{user_id}' not found."
 
     workout_data = {
@@ -77,15 +77,15 @@ def log_workout(user_id: str, workout_type: str, duration_minutes: int, calories
         "notes": notes,
     }
     
-    user.workouts["logged_workouts"].append(workout_data)
-    db_manager.update_user(user_id, {"workouts": user.workouts})
+    workouts.setdefault("logged_workouts", []).append(workout_data)
+    db_manager.update_user_section(user_id, "workouts", workouts)
     return f"Successfully logged a {duration_minutes}-minute {workout_type} workout for user {user_id}."
 
 def log_meal(user_id: str, meal_type: str, description: str, calories: Optional[int] = None, protein_g: Optional[int] = None, carbs_g: Optional[int] = None, fat_g: Optional[int] = None) -> str:
     """Logs a new meal for the user."""
     from .database_manager import db_manager
-    user = db_manager.get_user(user_id)
-    if not user:
+    nutrition = db_manager.get_user_section(user_id, "nutrition")
+    if nutrition is None:
         return f"Error: User with ID '{user_id}' not found."
 
     meal_data = {
@@ -97,8 +97,8 @@ def log_meal(user_id: str, meal_type: str, description: str, calories: Optional[
         "fat_g": fat_g,
     }
 
-    user.nutrition["daily_logs"].append(meal_data)
-    db_manager.update_user(user_id, {"nutrition": user.nutrition})
+    nutrition.setdefault("daily_logs", []).append(meal_data)
+    db_manager.update_user_section(user_id, "nutrition", nutrition)
     return f"Successfully logged a {meal_type} for user {user_id}."
 
 def create_or_update_goal(user_id: str, primary_goal: Optional[str] = None, target_weight_kg: Optional[float] = None, daily_calorie_target: Optional[int] = None) -> str:
@@ -115,7 +115,7 @@ def create_or_update_goal(user_id: str, primary_goal: Optional[str] = None, targ
     if daily_calorie_target:
         user.goals.daily_calorie_target = daily_calorie_target
     
-    db_manager.update_user(user_id, {"goals": user.goals.dict()})
+    db_manager.update_user(user_id, {"goals": user.goals.model_dump()})
     return f"Successfully updated goals for user {user_id}."
 
 def update_user_profile(user_id: str, **kwargs) -> str:
@@ -132,15 +132,15 @@ def update_user_profile(user_id: str, **kwargs) -> str:
     for key, value in updated_fields.items():
         setattr(user.profile, key, value)
     
-    db_manager.update_user(user_id, {"profile": user.profile.dict()})
+    db_manager.update_user(user_id, {"profile": user.profile.model_dump()})
     return f"Successfully updated profile for user {user_id}."
 
 def schedule_workout(user_id: str, workout_date: date, time_of_day: str, workout_type: str, intensity: str, duration_minutes: Optional[int] = None, notes: Optional[str] = None) -> str:
     """Schedules a new workout for the user."""
     from .database_manager import db_manager
     from .data_models import PlannedWorkout
-    user = db_manager.get_user(user_id)
-    if not user:
+    calendar = db_manager.get_user_section(user_id, "calendar")
+    if calendar is None:
         return f"Error: User with ID '{user_id}' not found."
 
     planned_workout = PlannedWorkout(
@@ -152,16 +152,16 @@ def schedule_workout(user_id: str, workout_date: date, time_of_day: str, workout
         notes=notes,
     )
     
-    user.calendar["scheduled_items"].append(planned_workout.dict())
-    db_manager.update_user(user_id, {"calendar": user.calendar})
+    calendar.setdefault("scheduled_items", []).append(planned_workout.model_dump(mode="json"))
+    db_manager.update_user_section(user_id, "calendar", calendar)
     return f"Successfully scheduled a {workout_type} workout for user {user_id} on {workout_date} in the {time_of_day}."
 
 def schedule_meal(user_id: str, meal_date: date, meal_type: str, description: str, calories: Optional[int] = None) -> str:
     """Schedules a new meal for the user."""
     from .database_manager import db_manager
     from .data_models import PlannedMeal
-    user = db_manager.get_user(user_id)
-    if not user:
+    calendar = db_manager.get_user_section(user_id, "calendar")
+    if calendar is None:
         return f"Error: User with ID '{user_id}' not found."
 
     planned_meal = PlannedMeal(
@@ -171,26 +171,28 @@ def schedule_meal(user_id: str, meal_date: date, meal_type: str, description: st
         calories=calories,
     )
 
-    user.calendar["scheduled_items"].append(planned_meal.dict())
-    db_manager.update_user(user_id, {"calendar": user.calendar})
+    calendar.setdefault("scheduled_items", []).append(planned_meal.model_dump(mode="json"))
+    db_manager.update_user_section(user_id, "calendar", calendar)
     return f"Successfully scheduled a {meal_type} for user {user_id} on {meal_date}."
 
 def get_schedule(user_id: str, start_date: date, end_date: Optional[date] = None) -> str:
     """Retrieves the user's schedule for a given date range."""
     from .database_manager import db_manager
-    user = db_manager.get_user(user_id)
-    if not user:
+    calendar = db_manager.get_user_section(user_id, "calendar")
+    if calendar is None:
         return f"Error: User with ID '{user_id}' not found."
 
     if end_date is None:
         end_date = start_date
 
+    # Stored dates are ISO strings, which sort the same as the dates themselves
+    start, end = start_date.isoformat(), end_date.isoformat()
     schedule = [
-        item for item in user.calendar.get("scheduled_items", [])
-        if start_date <= date.fromisoformat(item["workout_date" if "workout_date" in item else "meal_date"]) <= end_date
+        item for item in calendar.get("scheduled_items", [])
+        if start <= (item.get("workout_date") or item["meal_date"]) <= end
     ]
 
     if not schedule:
         return f"No scheduled items found for user {user_id} between {start_date} and {end_date}."
     
-    return json.dumps(schedule, default=str)
+    return orjson.dumps(schedule, default=str).decode()
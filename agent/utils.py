@@ -1,28 +1,37 @@
 import json
 import csv
+import sqlite3
 import sys
 import os
+from pydantic import ValidationError
 
-def export_chat_history_to_csv(json_file_path, csv_file_path):
+try:
+    from .data_models import User
+except ImportError:
+    # Run as a script (python agent/utils.py), so agent/ itself is on sys.path
+    from data_models import User
+
+def export_chat_history_to_csv(db_path, csv_file_path):
     """
-    Reads user conversation history from a JSON file and exports it to a CSV file.
+    Reads user conversation history from the SQLite database and exports it to a CSV file.
 
     Args:
-        json_file_path (str): The path to the input JSON file.
+        db_path (str): The path to the SQLite database file.
         csv_file_path (str): The path to the output CSV file.
     """
-    with open(json_file_path, 'r') as f:
-        data = json.load(f)
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute("SELECT user_id, data FROM users").fetchall()
+    finally:
+        conn.close()
 
     with open(csv_file_path, 'w', newline='', encoding='utf-8') as f:
         writer = csv.writer(f)
         # Write the header row
         writer.writerow(['user_id', 'user_message', 'agent_response'])
 
-        # The data is nested under a 'users' key, which in turn contains a dictionary of users
-        users = data.get('users', {})
-        for user_key, user_data in users.items():
-            user_id = user_data.get('user_id', user_key) # Use user_id field, fallback to key
+        for user_id, data in rows:
+            user_data = json.loads(data)
             conversation_history = user_data.get('ai_context', {}).get('conversation_history', [])
             for entry in conversation_history:
                 user_message = entry.get('user_message') or entry.get('user')
@@ -31,23 +40,72 @@ def export_chat_history_to_csv(json_file_path, csv_file_path):
                 if user_message is not None and agent_response is not None:
                     writer.writerow([user_id, user_message, agent_response])
 
+def migrate_tinydb_to_sqlite(json_file_path, db_path):
+    """
+    Copies users from a legacy TinyDB JSON file into the SQLite database.
+
+    Each record is validated as a User before it is written, so the stored
+    document always carries its user_id and the required sections. Users that
+    already exist in the database are left untouched.
+
+    Args:
+        json_file_path (str): The path to the legacy TinyDB JSON file.
+        db_path (str): The path to the SQLite database file.
+
+    Returns:
+        tuple: The number of users copied, and a list of (user_id, error)
+        pairs for records that failed validation and were skipped.
+    """
+    with open(json_file_path, 'r') as f:
+        data = json.load(f)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("CREATE TABLE IF NOT EXISTS users (user_id TEXT PRIMARY KEY, data TEXT NOT NULL)")
+        copied = 0
+        failed = []
+        # The data is nested under a 'users' key, which in turn contains a dictionary of users
+        for user_key, user_data in data.get('users', {}).items():
+            user_id = user_data.get('user_id', user_key) # Use user_id field, fallback to key
+            try:
+                user = User.model_validate({**user_data, "user_id": user_id})
+            except ValidationError as e:
+                failed.append((user_id, str(e)))
+                continue
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO users (user_id, data) VALUES (?, ?)",
+                (user_id, json.dumps(user.model_dump(mode="json"))),
+            )
+            copied += cursor.rowcount
+        conn.commit()
+    finally:
+        conn.close()
+    return copied, failed
+
 def main():
     """
     Main function to handle command-line arguments.
     """
     if len(sys.argv) < 2:
         print("Usage: python agent/utils.py <command>")
-        print("Available commands: export_chat_hist")
+        print("Available commands: export_chat_hist, migrate_tinydb")
         sys.exit(1)
 
     command = sys.argv[1]
 
     if command == 'export_chat_hist':
         # Assumes the script is run from the project root.
-        json_file_path = 'fuelyt_data.json'
+        db_path = 'fuelyt.db'
         csv_file_path = 'chat_history.csv'
-        export_chat_history_to_csv(json_file_path, csv_file_path)
+        export_chat_history_to_csv(db_path, csv_file_path)
         print(f"Chat history has been exported to {csv_file_path}")
+    elif command == 'migrate_tinydb':
+        json_file_path = 'fuelyt_data.json'
+        db_path = 'fuelyt.db'
+        copied, failed = migrate_tinydb_to_sqlite(json_file_path, db_path)
+        print(f"Copied {copied} users from {json_file_path} to {db_path}")
+        for user_id, error in failed:
+            print(f"Skipped invalid user {user_id}: {error}")
     else:
         print(f"Unknown command: {command}")
         sys.exit(1)
@@ -21,4 +21,4 @@ pip install --upgrade pip
 pip install -r agent/requirements.txt
 
 # Run the FastAPI application
-uvicorn agent.main:app --reload --port 8000
+uvicorn agent.main:app --reload --port 8000 --loop uvloop --http httptools